@@ -37,6 +37,12 @@ class GlancesHistory:
         """Get the history as a dict of list"""
         return {i: self.stats_history[i].history_raw(nb=nb) for i in self.stats_history}
 
+    def get_item(self, key, nb=0):
+        """Get the history of the given key as a list (None if key is not in the history)"""
+        if key not in self.stats_history:
+            return None
+        return self.stats_history[key].history_raw(nb=nb)
+
     def get_json(self, nb=0):
         """Get the history as a dict of list (with list JSON compliant)"""
         return {i: self.stats_history[i].history_json(nb=nb) for i in self.stats_history}
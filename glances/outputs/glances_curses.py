@@ -10,6 +10,8 @@
 
 import getpass
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 from glances.events_list import glances_events
 from glances.globals import MACOS, WINDOWS, disable, enable, itervalues, nativestr, u
@@ -30,6 +32,15 @@ except ImportError:
         logger.critical("For Windows you can try installing windows-curses with pip install.")
     sys.exit(1)
 
+# Stats display of the disabled plugins (shared between plugins, its size is
+# already set so get_stats_display_size never updates it)
+_EMPTY_STAT_DISPLAY = {
+    'display': False,
+    'msgdict': [],
+    'align': 'left',
+    'size': {'width': 0, 'width_without_option': 0, 'height': 1},
+}
+
 
 class _GlancesCurses:
     """This class manages the curses display (and key pressed).
@@ -124,6 +135,10 @@ class _GlancesCurses:
     _left_sidebar_min_width = 23
     _left_sidebar_max_width = 34
 
+    # Number of threads used to build the plugins messages (0: no thread pool)
+    # Can be overwritten by the configuration file ([outputs] curses_threads option)
+    _curses_threads = 0
+
     # Define right sidebar
     _right_sidebar = ['vms', 'containers', 'processcount', 'amps', 'processlist', 'alert']
 
@@ -132,7 +147,7 @@ class _GlancesCurses:
         self.config = config
         self.args = args
 
-        # Init windows positions
+        # Init windows positions (updated with the screen size on each display)
         self.term_w = 80
         self.term_h = 24
 
@@ -160,6 +175,11 @@ class _GlancesCurses:
         # Load configuration file
         self.load_config(config)
 
+        # Init the thread pool used to build the plugins messages (if enabled)
+        self._plugins_executor = None
+        if self._curses_threads > 0:
+            self._plugins_executor = ThreadPoolExecutor(max_workers=self._curses_threads)
+
         # Init cursor
         self._init_cursor()
 
@@ -203,6 +223,8 @@ class _GlancesCurses:
             )
             # Set the left sidebar list
             self._left_sidebar = config.get_list_value('outputs', 'left_menu', default=self._left_sidebar)
+            # Number of threads used to build the plugins messages
+            self._curses_threads = config.get_int_value('outputs', 'curses_threads', default=self._curses_threads)
 
     def _init_history(self):
         """Init the history option."""
@@ -421,6 +443,8 @@ class _GlancesCurses:
             curses.endwin()
         except Exception:
             pass
+        if self._plugins_executor is not None:
+            self._plugins_executor.shutdown(wait=False)
 
     def init_line_column(self):
         """Init the line and column position for the curses interface."""
@@ -451,8 +475,8 @@ class _GlancesCurses:
             return
         self.new_line()
         self.line -= 1
-        line_width = self.term_window.getmaxyx()[1] - self.column
-        if self.line >= 0 and self.line < self.term_window.getmaxyx()[0]:
+        line_width = self.term_w - self.column
+        if self.line >= 0 and self.line < self.term_h:
             position = [self.line, self.column]
             line_color = self.colors_list[color]
             line_type = curses.ACS_HLINE if not self.args.disable_unicode else unicode_message('MEDIUM_LINE', self.args)
@@ -479,22 +503,38 @@ class _GlancesCurses:
             * value: dict returned by the get_stats_display Plugin method
         """
         ret = {}
+        futures = {}
+
+        # Compute the plugin max size for the left sidebar (same for all its plugins)
+        left_sidebar_max_width = min(
+            self._left_sidebar_max_width,
+            max(self._left_sidebar_min_width, self.term_w - 105),
+        )
 
         for p in stats.getPluginsList(enable=False):
             # Ignore Quicklook because it is compute later in __display_top
             if p == 'quicklook':
                 continue
 
-            # Compute the plugin max size for the left sidebar
-            plugin_max_width = None
-            if p in self._left_sidebar:
-                plugin_max_width = min(
-                    self._left_sidebar_max_width,
-                    max(self._left_sidebar_min_width, self.term_window.getmaxyx()[1] - 105),
+            # Do not build the messages of the disabled plugins
+            plugin = stats.get_plugin(p)
+            if plugin.is_disabled():
+                ret[p] = _EMPTY_STAT_DISPLAY
+                continue
+
+            plugin_max_width = left_sidebar_max_width if p in self._left_sidebar else None
+
+            # Get the view (in the thread pool if enabled)
+            if self._plugins_executor is None:
+                ret[p] = plugin.get_stats_display(args=self.args, max_width=plugin_max_width)
+            else:
+                futures[p] = self._plugins_executor.submit(
+                    plugin.get_stats_display, args=self.args, max_width=plugin_max_width
                 )
 
-            # Get the view
-            ret[p] = stats.get_plugin(p).get_stats_display(args=self.args, max_width=plugin_max_width)
+        # Wait for the views built in the thread pool
+        for p, future in futures.items():
+            ret[p] = future.result()
 
         return ret
 
@@ -513,6 +553,9 @@ class _GlancesCurses:
         # Init the internal line/column for Glances Curses
         self.init_line_column()
 
+        # Get the screen size once for all the layout computation
+        self.term_h, self.term_w = self.term_window.getmaxyx()
+
         # Update the stats messages
         ###########################
 
@@ -654,11 +697,11 @@ class _GlancesCurses:
         for i in ['system', 'ip', 'uptime']:
             if i in stat_display:
                 l_uptime += self.get_stats_display_width(stat_display[i])
-        self.display_plugin(stat_display["system"], display_optional=(self.term_window.getmaxyx()[1] >= l_uptime))
+        self.display_plugin(stat_display["system"], display_optional=(self.term_w >= l_uptime))
         self.space_between_column = 3
         if 'ip' in stat_display:
             self.new_column()
-            self.display_plugin(stat_display["ip"], display_optional=(self.term_window.getmaxyx()[1] >= 100))
+            self.display_plugin(stat_display["ip"], display_optional=(self.term_w >= 100))
         self.new_column()
         self.display_plugin(
             stat_display["uptime"], add_space=-(self.get_stats_display_width(stat_display["cloud"]) != 0)
@@ -698,12 +741,10 @@ class _GlancesCurses:
         if not self.args.disable_quicklook:
             # Quick look is in the place !
             if self.args.full_quicklook:
-                quicklook_width = self.term_window.getmaxyx()[1] - (
-                    stats_width + 8 + stats_number * self.space_between_column
-                )
+                quicklook_width = self.term_w - (stats_width + 8 + stats_number * self.space_between_column)
             else:
                 quicklook_width = min(
-                    self.term_window.getmaxyx()[1] - (stats_width + 8 + stats_number * self.space_between_column),
+                    self.term_w - (stats_width + 8 + stats_number * self.space_between_column),
                     self._quicklook_max_width - 5,
                 )
             try:
@@ -725,7 +766,7 @@ class _GlancesCurses:
         for p in self._top:
             plugin_display_optional[p] = True
         if stats_number > 1:
-            self.space_between_column = max(1, int((self.term_window.getmaxyx()[1] - stats_width) / (stats_number - 1)))
+            self.space_between_column = max(1, int((self.term_w - stats_width) / (stats_number - 1)))
             for p in ['mem', 'cpu']:
                 # No space ? Remove optional stats
                 if self.space_between_column < 3:
@@ -736,9 +777,7 @@ class _GlancesCurses:
                         else 0
                     )
                     stats_width = sum(itervalues(plugin_widths)) + 1
-                    self.space_between_column = max(
-                        1, int((self.term_window.getmaxyx()[1] - stats_width) / (stats_number - 1))
-                    )
+                    self.space_between_column = max(1, int((self.term_w - stats_width) / (stats_number - 1)))
         else:
             self.space_between_column = 0
 
@@ -771,7 +810,7 @@ class _GlancesCurses:
                 if p == 'sensors':
                     self.display_plugin(
                         stat_display['sensors'],
-                        max_y=(self.term_window.getmaxyx()[0] - self.get_stats_display_height(stat_display['now']) - 2),
+                        max_y=(self.term_h - self.get_stats_display_height(stat_display['now']) - 2),
                     )
                 else:
                     self.display_plugin(stat_display[p])
@@ -782,7 +821,7 @@ class _GlancesCurses:
         docker + processcount + amps + processlist + alert
         """
         # Do not display anything if space is not available...
-        if self.term_window.getmaxyx()[1] < self._left_sidebar_min_width:
+        if self.term_w < self._left_sidebar_min_width:
             return
 
         # Restore line position
@@ -796,11 +835,9 @@ class _GlancesCurses:
                 if p == 'processlist':
                     self.display_plugin(
                         stat_display['processlist'],
-                        display_optional=(self.term_window.getmaxyx()[1] > 102),
+                        display_optional=(self.term_w > 102),
                         display_additional=(not MACOS),
-                        max_y=(
-                            self.term_window.getmaxyx()[0] - self.get_stats_display_height(stat_display['alert']) - 2
-                        ),
+                        max_y=(self.term_h - self.get_stats_display_height(stat_display['alert']) - 2),
                     )
                 else:
                     self.display_plugin(stat_display[p])
@@ -926,7 +963,7 @@ class _GlancesCurses:
         return None
 
     def setup_upper_left_pos(self, plugin_stats):
-        screen_y, screen_x = self.term_window.getmaxyx()
+        screen_y, screen_x = self.term_h, self.term_w
 
         if plugin_stats['align'] == 'right':
             # Right align (last column)
@@ -948,8 +985,9 @@ class _GlancesCurses:
         # UTF-8 special tree chars occupy several bytes.
         # Python 3: strings are strings and bytes are bytes, all is
         # good.
+        msg = m['msg']
         try:
-            x += len(u(m['msg']))
+            x += len(msg if isinstance(msg, str) else u(msg))
         except UnicodeDecodeError:
             # Quick and dirty hack for issue #745
             pass
@@ -959,7 +997,7 @@ class _GlancesCurses:
         return x, x_max
 
     def display_stats_with_current_size(self, m, y, x):
-        screen_x = self.term_window.getmaxyx()[1]
+        screen_x = self.term_w
         self.term_window.addnstr(
             y,
             x,
@@ -1021,7 +1059,7 @@ class _GlancesCurses:
             return 0
 
         # Get the screen size
-        screen_y, screen_x = self.term_window.getmaxyx()
+        screen_y, screen_x = self.term_h, self.term_w
 
         # Set the upper/left position of the message
         display_y, display_x = self.setup_upper_left_pos(plugin_stats)
@@ -1107,10 +1145,15 @@ class _GlancesCurses:
         # Wait duration (in s) time
         isexitkey = False
         countdown = Timer(duration)
-        # Set the default timeout (in ms) between two getch
-        self.term_window.timeout(100)
+        # The redraw is done once all the pending keys have been processed
+        redraw = False
         while not countdown.finished() and not isexitkey:
-            # Getkey
+            # Getkey: block until a key is pressed or the countdown is over (timeout in ms)
+            # Do not block if a redraw is waiting, only read the pending keys
+            if redraw:
+                self.term_window.timeout(0)
+            else:
+                self.term_window.timeout(max(1, int((countdown.duration - countdown.get()) * 1000)))
             pressedkey = self.__catch_key(return_to_browser=return_to_browser)
             isexitkey = pressedkey == ord('\x1b') or pressedkey == ord('q')
 
@@ -1129,11 +1172,12 @@ class _GlancesCurses:
                 self.args.help_tag = not self.args.help_tag
                 return False
 
-            if not isexitkey and pressedkey > -1:
-                # Redraw display
+            if pressedkey == -1 and redraw:
+                # No more pending key, redraw display
                 self.flush(stats, cs_status=cs_status)
-                # Overwrite the timeout with the countdown
-                self.wait(delay=int(countdown.get() * 1000))
+                redraw = False
+            elif not isexitkey and pressedkey > -1:
+                redraw = True
 
         return isexitkey
 
@@ -1143,48 +1187,65 @@ class _GlancesCurses:
 
     def get_stats_display_width(self, curse_msg, without_option=False):
         """Return the width of the formatted curses message."""
-        try:
-            if without_option:
-                # Size without options
-                c = len(
-                    max(
-                        ''.join(
-                            [
-                                (u(u(nativestr(i['msg'])).encode('ascii', 'replace')) if not i['optional'] else "")
-                                for i in curse_msg['msgdict']
-                            ]
-                        ).split('\n'),
-                        key=len,
-                    )
-                )
-            else:
-                # Size with all options
-                c = len(
-                    max(
-                        ''.join(
-                            [u(u(nativestr(i['msg'])).encode('ascii', 'replace')) for i in curse_msg['msgdict']]
-                        ).split('\n'),
-                        key=len,
-                    )
-                )
-        except Exception as e:
-            logger.debug(f'ERROR: Can not compute plugin width ({e})')
-            return 0
-        else:
-            return c
+        return self.get_stats_display_size(curse_msg)['width_without_option' if without_option else 'width']
 
     def get_stats_display_height(self, curse_msg):
         """Return the height of the formatted curses message.
 
         The height is defined by the number of '\n' (new line).
         """
+        return self.get_stats_display_size(curse_msg)['height']
+
+    def get_stats_display_size(self, curse_msg):
+        """Return the size of the formatted curses message.
+
+        Width (with and without the optional stats) and height are computed
+        in a single pass on the messages, and cached in the curse_msg dict
+        (a new one is built by the plugin on each refresh).
+
+        :return: dict with the width, width_without_option and height keys
+        """
         try:
-            c = [i['msg'] for i in curse_msg['msgdict']].count('\n')
+            return curse_msg['size']
+        except (KeyError, TypeError):
+            pass
+
+        try:
+            width = width_without_option = 0
+            line_width = line_width_without_option = 0
+            nb_lines = 1
+            # Only the msg and optional fields are needed, extract them in C (itemgetter)
+            for msg, optional in map(itemgetter('msg', 'optional'), curse_msg['msgdict']):
+                if not isinstance(msg, str):
+                    # Only convert the (rare) non str messages
+                    msg = nativestr(msg)
+                if '\n' not in msg:
+                    # Most of the messages are on a single line
+                    line_width += len(msg)
+                    if not optional:
+                        line_width_without_option += len(msg)
+                    continue
+                if msg == '\n':
+                    nb_lines += 1
+                lines = msg.split('\n')
+                inner_width = max(map(len, lines[1:-1]), default=0)
+                width = max(width, line_width + len(lines[0]), inner_width)
+                line_width = len(lines[-1])
+                if not optional:
+                    width_without_option = max(
+                        width_without_option, line_width_without_option + len(lines[0]), inner_width
+                    )
+                    line_width_without_option = len(lines[-1])
         except Exception as e:
-            logger.debug(f'ERROR: Can not compute plugin height ({e})')
-            return 0
-        else:
-            return c + 1
+            logger.debug(f'ERROR: Can not compute plugin size ({e})')
+            return {'width': 0, 'width_without_option': 0, 'height': 0}
+
+        curse_msg['size'] = {
+            'width': max(width, line_width),
+            'width_without_option': max(width_without_option, line_width_without_option),
+            'height': nb_lines,
+        }
+        return curse_msg['size']
 
 
 class GlancesCursesStandalone(_GlancesCurses):
@@ -11,7 +11,7 @@
 import psutil
 
 from glances.cpu_percent import cpu_percent
-from glances.globals import LINUX, SUNOS, WINDOWS, iterkeys
+from glances.globals import LINUX, SUNOS, WINDOWS
 from glances.plugins.core import PluginModel as CorePluginModel
 from glances.plugins.plugin.model import GlancesPluginModel
 
@@ -133,6 +133,33 @@ items_history_list = [
     {'name': 'system', 'description': 'System CPU usage', 'y_unit': '%'},
 ]
 
+# Define the curses constant labels of the first line
+curse_title = f'{"CPU":8}'
+curse_idle_label = f'  {"idle":8}'
+
+# Define the curses layout from the second line
+# - one list of (keys, width, header) per line
+# - keys: the first stat available in this tuple will be displayed
+curse_lines = [
+    # user|idle + irq + interrupts
+    [(('user', 'idle'), 15, ''), (('irq',), 14, '  '), (('interrupts',), 15, '  ')],
+    # system + nice + sw_int
+    # On WINDOWS/SUNOS the ctx_switches is displayed in the third line (instead of sw_int)
+    [
+        (('system',), 15, ''),
+        (('nice',), 14, '  '),
+        (('ctx_switches',) if WINDOWS or SUNOS else ('soft_interrupts',), 15, '  '),
+    ],
+    # iowait|dpc + steal + (syscalls or guest)
+    # syscalls: number of system calls since boot. Always set to 0 on Linux. (do not display)
+    # So instead on Linux we display the guest CPU usage (see #2667)
+    [
+        (('iowait', 'dpc'), 15, ''),
+        (('steal',), 14, '  '),
+        (('guest',), 14, '  ') if LINUX else (('syscalls',), 15, '  '),
+    ],
+]
+
 
 class PluginModel(GlancesPluginModel):
     """Glances CPU plugin.
@@ -150,6 +177,9 @@ class PluginModel(GlancesPluginModel):
         # We want to display the stat in the curse interface
         self.display_curse = True
 
+        # Last curse message with the stats and views used to build it (see msg_curse)
+        self._msg_curse_cache = (None, None, [])
+
         # Call CorePluginModel in order to display the core number
         try:
             self.nb_log_core = CorePluginModel(args=self.args).update()["log"]
@@ -242,7 +272,7 @@ class PluginModel(GlancesPluginModel):
             stats['idle'] = 0
             for c in cpu_stats:
                 if c.startswith('percent'):
-                    stats['idle'] += float(cpu_stats['percent.3'])
+                    stats['idle'] += float(cpu_stats[c])
                     stats['nb_log_core'] += 1
             if stats['nb_log_core'] > 0:
                 stats['idle'] = stats['idle'] / stats['nb_log_core']
@@ -261,8 +291,7 @@ class PluginModel(GlancesPluginModel):
                 return self.stats
 
             # Convert SNMP stats to float
-            for key in iterkeys(stats):
-                stats[key] = float(stats[key])
+            stats = {k: float(v) for k, v in stats.items()}
             stats['total'] = 100 - stats['idle']
 
         return stats
@@ -314,74 +343,42 @@ class PluginModel(GlancesPluginModel):
         if not self.stats or self.args.percpu or self.is_disabled():
             return ret
 
+        # Stats and views are new objects on each update, so the message built
+        # since the last update can be reused (ex: screen redraw on key pressed)
+        cache_stats, cache_views, cache_msg = self._msg_curse_cache
+        if cache_stats is self.stats and cache_views is self.views:
+            return cache_msg
+
         # Some tag to enable/disable stats (example: idle_tag triggered on Windows OS)
         idle_tag = 'user' not in self.stats
 
         # First line
         # Total + (idle) + ctx_sw
-        msg = '{:8}'.format('CPU')
-        ret.append(self.curse_add_line(msg, "TITLE"))
+        ret.append(self.curse_add_line(curse_title, "TITLE"))
         # Total CPU usage
-        msg = '{:5.1f}%'.format(self.stats['total'])
-        ret.append(self.curse_add_line(msg, self.get_views(key='total', option='decoration')))
+        msg = f"{self.stats['total']:5.1f}%"
+        ret.append(self.curse_add_line(msg, self.views.get('total', {}).get('decoration', 'DEFAULT')))
         # Idle CPU
         if 'idle' in self.stats and not idle_tag:
-            msg = '  {:8}'.format('idle')
-            ret.append(self.curse_add_line(msg, optional=self.get_views(key='idle', option='optional')))
-            msg = '{:4.1f}%'.format(self.stats['idle'])
-            ret.append(self.curse_add_line(msg, optional=self.get_views(key='idle', option='optional')))
+            idle_optional = self.views.get('idle', {}).get('optional', False)
+            ret.append(self.curse_add_line(curse_idle_label, optional=idle_optional))
+            msg = f"{self.stats['idle']:4.1f}%"
+            ret.append(self.curse_add_line(msg, optional=idle_optional))
         # ctx_switches
         # On WINDOWS/SUNOS the ctx_switches is displayed in the third line
         if not WINDOWS and not SUNOS:
             ret.extend(self.curse_add_stat('ctx_switches', width=15, header='  '))
 
-        # Second line
-        # user|idle + irq + interrupts
-        ret.append(self.curse_new_line())
-        # User CPU
-        if not idle_tag:
-            ret.extend(self.curse_add_stat('user', width=15))
-        elif 'idle' in self.stats:
-            ret.extend(self.curse_add_stat('idle', width=15))
-        # IRQ CPU
-        ret.extend(self.curse_add_stat('irq', width=14, header='  '))
-        # interrupts
-        ret.extend(self.curse_add_stat('interrupts', width=15, header='  '))
-
-        # Third line
-        # system|core + nice + sw_int
-        ret.append(self.curse_new_line())
-        # System CPU
-        if not idle_tag:
-            ret.extend(self.curse_add_stat('system', width=15))
-        else:
-            ret.extend(self.curse_add_stat('core', width=15))
-        # Nice CPU
-        ret.extend(self.curse_add_stat('nice', width=14, header='  '))
-        # soft_interrupts
-        if not WINDOWS and not SUNOS:
-            ret.extend(self.curse_add_stat('soft_interrupts', width=15, header='  '))
-        else:
-            ret.extend(self.curse_add_stat('ctx_switches', width=15, header='  '))
+        # Second to fourth lines (see curse_lines)
+        for line in curse_lines:
+            ret.append(self.curse_new_line())
+            for keys, width, header in line:
+                # Display the first available stat
+                key = next((k for k in keys if k in self.stats), None)
+                if key is not None:
+                    ret.extend(self.curse_add_stat(key, width=width, header=header))
 
-        # Fourth line
-        # iowait + steal + (syscalls or guest)
-        ret.append(self.curse_new_line())
-        if 'iowait' in self.stats:
-            # IOWait CPU
-            ret.extend(self.curse_add_stat('iowait', width=15))
-        elif 'dpc' in self.stats:
-            # DPC CPU
-            ret.extend(self.curse_add_stat('dpc', width=15))
-        # Steal CPU usage
-        ret.extend(self.curse_add_stat('steal', width=14, header='  '))
-        if not LINUX:
-            # syscalls: number of system calls since boot. Always set to 0 on Linux. (do not display)
-            ret.extend(self.curse_add_stat('syscalls', width=15, header='  '))
-        else:
-            # So instead on Linux we display the guest CPU usage (see #2667)
-            # guest: time spent running a virtual CPU for guest operating systems under
-            ret.extend(self.curse_add_stat('guest', width=14, header='  '))
+        self._msg_curse_cache = (self.stats, self.views, ret)
 
         # Return the message with decoration
         return ret
@@ -120,6 +120,16 @@ class GlancesPluginModel:
 
         # Init stats description
         self.fields_description = fields_description
+        # Cache of the curse_add_stat information derived from the description (see _get_curse_stat_info)
+        self._curse_stat_info = {}
+        # Namedtuple fields kept by filter_stats, by namedtuple type
+        self._namedtuple_fields = {}
+        # Fields with the rate=True flag, with their _gauge and _rate_per_sec names (see _manage_rate)
+        self._rate_fields = [
+            (field, field + '_gauge', field + '_rate_per_sec')
+            for field, description in (fields_description or {}).items()
+            if description.get('rate') is True
+        ]
 
         # Init the stats
         self.stats_init_value = stats_init_value
@@ -226,12 +236,10 @@ class GlancesPluginModel:
         - the stats history for the given item (list) instead
         - None if item did not exist in the history
         """
-        s = self.stats_history.get(nb=nb)
         if item is None:
-            return s
-        if item in s:
-            return s[item]
-        return None
+            return self.stats_history.get(nb=nb)
+        # Only get the history of the given item (called on each refresh by get_trend)
+        return self.stats_history.get_item(item, nb=nb)
 
     def get_export_history(self, item=None):
         """Return the stats history object to export."""
@@ -706,7 +714,13 @@ class GlancesPluginModel:
     def filter_stats(self, stats):
         """Filter the stats to keep only the fields we want (the one defined in fields_description)."""
         if hasattr(stats, '_asdict'):
-            return {k: v for k, v in stats._asdict().items() if k in self.fields_description}
+            # Namedtuple (psutil object): the fields to keep are the same for all the
+            # objects of a given type, so compute their (index, name) once
+            fields = self._namedtuple_fields.get(type(stats))
+            if fields is None:
+                fields = tuple((i, k) for i, k in enumerate(stats._fields) if k in self.fields_description)
+                self._namedtuple_fields[type(stats)] = fields
+            return {k: stats[i] for i, k in fields}
         if isinstance(stats, dict):
             return {k: v for k, v in stats.items() if k in self.fields_description}
         if isinstance(stats, list):
@@ -957,45 +971,13 @@ class GlancesPluginModel:
         if key not in self.stats:
             return []
 
-        # Check if a shortname is defined
-        if not display_key:
-            key_name = ''
-        elif key in self.fields_description and 'short_name' in self.fields_description[key]:
-            key_name = self.fields_description[key]['short_name']
-        else:
-            key_name = key
+        # Name, unit and value key only depend on the fields_description, compute them once
+        if key not in self._curse_stat_info:
+            self._curse_stat_info[key] = self._get_curse_stat_info(key)
+        short_name, unit_short, unit_type, min_symbol, value_key = self._curse_stat_info[key]
 
-        # Check if unit is defined and get the short unit char in the unit_sort dict
-        if (
-            key in self.fields_description
-            and 'unit' in self.fields_description[key]
-            and self.fields_description[key]['unit'] in fields_unit_short
-        ):
-            # Get the shortname
-            unit_short = fields_unit_short[self.fields_description[key]['unit']]
-        else:
-            unit_short = ''
-
-        # Check if unit is defined and get the unit type unit_type dict
-        if (
-            key in self.fields_description
-            and 'unit' in self.fields_description[key]
-            and self.fields_description[key]['unit'] in fields_unit_type
-        ):
-            # Get the shortname
-            unit_type = fields_unit_type[self.fields_description[key]['unit']]
-        else:
-            unit_type = 'float'
-
-        # Is it a rate ? Yes, get the pre-computed rate value
-        if (
-            key in self.fields_description
-            and 'rate' in self.fields_description[key]
-            and self.fields_description[key]['rate'] is True
-        ):
-            value = self.stats.get(key + '_rate_per_sec', None)
-        else:
-            value = self.stats.get(key, None)
+        key_name = short_name if display_key else ''
+        value = self.stats.get(value_key, None)
 
         if width is None:
             msg_item = header + f'{key_name}' + separator
@@ -1013,24 +995,45 @@ class GlancesPluginModel:
             msg_value = msg_template.format('-', '')
         elif unit_type == 'float':
             msg_value = msg_template_float.format(value, unit_short)
-        elif 'min_symbol' in self.fields_description[key]:
-            msg_value = msg_template.format(
-                self.auto_unit(int(value), min_symbol=self.fields_description[key]['min_symbol']), unit_short
-            )
+        elif min_symbol is not None:
+            msg_value = msg_template.format(self.auto_unit(int(value), min_symbol=min_symbol), unit_short)
         else:
             msg_value = msg_template.format(int(value), unit_short)
 
         # Add the trailer
         msg_value = msg_value + trailer
 
-        decoration = self.get_views(key=key, option='decoration') if value is not None else 'DEFAULT'
-        optional = self.get_views(key=key, option='optional')
+        # Get the stat view once for both options
+        view = self.views.get(key, {})
+        decoration = view.get('decoration', 'DEFAULT') if value is not None else 'DEFAULT'
+        optional = view.get('optional', False)
 
         return [
             self.curse_add_line(msg_item, optional=optional),
             self.curse_add_line(msg_value, decoration=decoration, optional=optional),
         ]
 
+    def _get_curse_stat_info(self, key):
+        """Return the (short_name, unit_short, unit_type, min_symbol, value_key) tuple used by curse_add_stat."""
+        field_description = self.fields_description.get(key, {})
+
+        # Check if a shortname is defined
+        short_name = field_description.get('short_name', key)
+
+        # Check if unit is defined and get the short unit char in the unit_sort dict
+        unit_short = fields_unit_short.get(field_description.get('unit'), '')
+
+        # Check if unit is defined and get the unit type unit_type dict
+        unit_type = fields_unit_type.get(field_description.get('unit'), 'float')
+
+        # Auto unit symbol (None if not defined)
+        min_symbol = field_description.get('min_symbol')
+
+        # Is it a rate ? Yes, get the pre-computed rate value
+        value_key = key + '_rate_per_sec' if field_description.get('rate') is True else key
+
+        return short_name, unit_short, unit_type, min_symbol, value_key
+
     @property
     def align(self):
         """Get the curse align."""
@@ -1157,26 +1160,27 @@ class GlancesPluginModel:
             if stat_previous is None:
                 return stat
 
+            if not self._rate_fields:
+                return stat
+
             # 1) set _gauge for all the rate fields
             # 2) compute the _rate_per_sec
             # 3) set the original field to the delta between the current and the previous value
-            for field in self.fields_description:
-                # For all the field with the rate=True flag
-                if 'rate' in self.fields_description[field] and self.fields_description[field]['rate'] is True:
-                    # Create a new metadata with the gauge
-                    stat['time_since_update'] = self.time_since_last_update
-                    stat[field + '_gauge'] = stat[field]
-                    if field + '_gauge' in stat_previous and stat[field] and stat_previous[field + '_gauge']:
-                        # The stat becomes the delta between the current and the previous value
-                        stat[field] = stat[field] - stat_previous[field + '_gauge']
-                        # Compute the rate
-                        if self.time_since_last_update > 0:
-                            stat[field + '_rate_per_sec'] = stat[field] // self.time_since_last_update
-                        else:
-                            stat[field] = 0
+            stat['time_since_update'] = self.time_since_last_update
+            for field, gauge_field, rate_field in self._rate_fields:
+                # Create a new metadata with the gauge
+                stat[gauge_field] = stat[field]
+                if gauge_field in stat_previous and stat[field] and stat_previous[gauge_field]:
+                    # The stat becomes the delta between the current and the previous value
+                    stat[field] = stat[field] - stat_previous[gauge_field]
+                    # Compute the rate
+                    if self.time_since_last_update > 0:
+                        stat[rate_field] = stat[field] // self.time_since_last_update
                     else:
-                        # Avoid strange rate at the first run
                         stat[field] = 0
+                else:
+                    # Avoid strange rate at the first run
+                    stat[field] = 0
             return stat
 
         def compute_rate_on_list(self, stats, stats_previous):
@@ -14,7 +14,6 @@ import time
 from glances.globals import WINDOWS
 from glances.logger import logger
 from glances.outdated import Outdated
-from glances.outputs.glances_curses import GlancesCursesStandalone
 from glances.outputs.glances_stdout import GlancesStdout
 from glances.outputs.glances_stdout_apidoc import GlancesStdoutApiDoc
 from glances.outputs.glances_stdout_csv import GlancesStdoutCsv
@@ -106,6 +105,9 @@ class GlancesStandalone:
             glances_processes.max_processes = 50
 
             # Init screen
+            # Curses is only imported here: the others modes (quiet, stdout...) can run without it
+            from glances.outputs.glances_curses import GlancesCursesStandalone
+
             self.screen = GlancesCursesStandalone(config=config, args=args)
 
             # If an error occur during the screen init, continue if export option is set
@@ -16,12 +16,15 @@ import time
 import unittest
 from datetime import datetime
 
+import psutil
+
 from glances import __version__
 from glances.events_list import GlancesEventsList
 from glances.filter import GlancesFilter, GlancesFilterList
 from glances.globals import LINUX, WINDOWS, pretty_date, string_value_to_float, subsample
 from glances.main import GlancesMain
 from glances.outputs.glances_bars import Bar
+from glances.plugins.cpu import PluginModel as CpuPluginModel
 from glances.plugins.plugin.model import GlancesPluginModel
 from glances.programs import processes_to_programs
 from glances.stats import GlancesStats
@@ -577,6 +580,36 @@ class TestGlances(unittest.TestCase):
         self.assertEqual(pretty_date(datetime(2023, 1, 1, 0, 0), datetime(2024, 1, 1, 12, 0)), '1 year')
         self.assertEqual(pretty_date(datetime(2020, 1, 1, 0, 0), datetime(2024, 1, 1, 12, 0)), '4 years')
 
+    def test_022_filter_stats(self):
+        """Test filter_stats on psutil namedtuple"""
+        print('INFO: [TEST_022] filter_stats')
+        cpu = stats.get_plugin('cpu')
+        cpu_times_percent = psutil.cpu_times_percent(interval=0.0)
+        filtered_stats = cpu.filter_stats(cpu_times_percent)
+        self.assertIsInstance(filtered_stats, dict)
+        self.assertTrue(all(k in cpu.fields_description for k in filtered_stats))
+        self.assertEqual(filtered_stats['user'], cpu_times_percent.user)
+        self.assertEqual(
+            cpu.filter_stats(psutil.cpu_stats()).keys(), cpu.filter_stats(psutil.cpu_stats()._asdict()).keys()
+        )
+
+    def test_023_cpu_snmp(self):
+        """Test CPU stats grabbed using SNMP"""
+        print('INFO: [TEST_023] CPU SNMP stats')
+        cpu = CpuPluginModel(args=test_args)
+        # Windows: one percent value per core
+        cpu.short_system_name = 'windows'
+        cpu.get_stats_snmp = lambda **kwargs: {'percent.1': '10', 'percent.2': '30', 'percent.3': '50'}
+        cpu_stats = cpu.update_snmp()
+        self.assertEqual(cpu_stats['nb_log_core'], 3)
+        self.assertEqual(cpu_stats['total'], 30.0)
+        # Default: user, system and idle
+        cpu.short_system_name = 'linux'
+        cpu.get_stats_snmp = lambda **kwargs: {'user': '1', 'system': '2', 'idle': '97'}
+        cpu_stats = cpu.update_snmp()
+        self.assertEqual(cpu_stats['idle'], 97.0)
+        self.assertEqual(cpu_stats['total'], 3.0)
+
     def test_094_thresholds(self):
         """Test thresholds classes"""
         print('INFO: [TEST_094] Thresholds')
@@ -651,6 +684,9 @@ class TestGlances(unittest.TestCase):
         h.add('b', 30, history_max_size=100)
         self.assertEqual(len(h.get()), 2)
         self.assertEqual(len(h.get()['a']), 3)
+        self.assertEqual(h.get_item('a'), h.get()['a'])
+        self.assertEqual(len(h.get_item('b', nb=2)), 2)
+        self.assertIsNone(h.get_item('c'))
         h.reset()
         self.assertEqual(len(h.get()), 2)
         self.assertEqual(len(h.get()['a']), 0)